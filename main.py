@@ -1,18 +1,27 @@
 import sys
 import json
-from collections import defaultdict, deque
+import sqlite3
+import functools
+from contextlib import contextmanager
+from collections import Counter
+from operator import attrgetter, itemgetter
+from dataclasses import dataclass, asdict, is_dataclass, fields, MISSING
 from datetime import datetime
 
-from PySide6.QtCore import Qt, QDateTime
-from PySide6.QtGui import QAction, QPalette, QColor
+from PySide6.QtCore import (
+    Qt, QDateTime, QEvent, QObject, Signal, QAbstractTableModel, QModelIndex,
+    QThreadPool
+)
+from PySide6.QtGui import QAction, QPalette, QColor, QBrush
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout,
     QHBoxLayout, QFormLayout, QLineEdit, QLabel, QPushButton, QComboBox,
-    QTableWidget, QTableWidgetItem, QSpinBox, QMessageBox, QFileDialog,
-    QDialog, QDialogButtonBox, QDateTimeEdit
+    QTableView, QAbstractItemView, QHeaderView, QSpinBox,
+    QMessageBox, QFileDialog, QDialog, QDialogButtonBox, QDateTimeEdit,
+    QStyledItemDelegate, QStyleOptionButton, QStyle
 )
 from PySide6.QtCharts import (
-    QChart, QChartView, QPieSeries, QBarSeries, QBarSet, QCategoryAxis
+    QChart, QChartView, QPieSeries, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis
 )
 
 ###############################################################################
@@ -96,8 +105,71 @@ BIKE_INVENTORY = {
     "Offroad": 0
 }
 
+@dataclass(slots=True)
+class Order:
+    order_id: int  # position in ORDERS
+    customer_name: str
+    contact_info: str
+    delivery_address: str
+    bike_model: str
+    bike_size: str
+    bike_color: str
+    wheel_size: str
+    gears: str
+    brakes: str
+    lights: str
+    status: str = "Pending"
+
+
+def _json_default(obj):
+    """json.dump() hook: write dataclass records (e.g. Order) as plain objects."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _record_from_dict(cls, data):
+    """
+    Build a dataclass record (e.g. Order) from a loaded dict. Unknown keys are
+    ignored; a missing key gets the field's default, or "" if it has none.
+    """
+    return cls(**{
+        field.name: data.get(field.name, "" if field.default is MISSING else field.default)
+        for field in fields(cls)
+    })
+
+
+def write_json_sections(f, sections):
+    """
+    Write `sections` ((name, value) pairs) to `f` as one compact JSON object.
+    List values are encoded one record at a time, so the encoder only ever
+    buffers a single record rather than the whole file.
+    """
+    separators = (",", ":")
+    f.write("{")
+    for i, (name, value) in enumerate(sections):
+        if i:
+            f.write(",")
+        f.write(json.dumps(name) + ":")
+        if isinstance(value, list):
+            f.write("[")
+            for j, record in enumerate(value):
+                if j:
+                    f.write(",")
+                f.write(json.dumps(record, separators=separators, default=_json_default))
+            f.write("]")
+        else:
+            json.dump(value, f, separators=separators, default=_json_default)
+    f.write("}")
+
+
 ORDERS = []
 
+# Kept in step with ORDERS so refreshes never have to re-scan it
+PENDING_ORDERS = []
+COMPLETED_COUNT = 0
+ORDER_MODEL_COUNTS = Counter()  # bike model -> number of orders (Reports bar chart)
+
 PRODUCTION_STATUS = {
     "FrameWelded": 0,
     "ForkWelded": 0,
@@ -124,9 +196,461 @@ STATION_REQUIREMENTS = {
     "SeatInstallation": {"LightAddition": 1}
 }
 
-MAINTENANCE_RECORDS = deque()
-SHIFTS = []
-SCHEDULE = []
+def _compile_requirements(requirements):
+    """
+    Resolve once which global dict each requirement is drawn from, giving
+    (source_dict, key, amount) tuples that can be checked and deducted in a
+    straight loop. Load Data updates the globals in place, so the dict
+    references stay valid.
+    """
+    return [
+        (INVENTORY_DATA if key in INVENTORY_DATA else PRODUCTION_STATUS, key, amount)
+        for key, amount in requirements.items()
+    ]
+
+
+COMPILED_STATION_REQS = {
+    station: _compile_requirements(reqs) for station, reqs in STATION_REQUIREMENTS.items()
+}
+COMPILED_BIKE_RECIPES = {
+    model: _compile_requirements(parts) for model, parts in BIKE_TYPE_PARTS.items()
+}
+
+# Bumped at every mutation site so views can tell whether their data changed
+DATA_VERSIONS = {
+    "inventory": 0,
+    "bike_inventory": 0,
+    "orders": 0,
+    "production": 0
+}
+
+@dataclass(slots=True)
+class Shift:
+    employee: str
+    start: str
+    end: str
+    role: str
+
+
+@dataclass(slots=True)
+class ScheduleEntry:
+    datetime: str = ""
+    task: str = ""
+    notes: str = ""
+
+
+MAINTENANCE_RECORDS = []  # (station, date_str, description); only appended to
+SHIFTS = []    # Shift records
+SCHEDULE = []  # ScheduleEntry records
+
+# Combo box choices, built once rather than in every tab's __init__
+ROLE_CHOICES = ("Admin", "ProductionWorker", "InventoryManager", "Sales")
+SHIFT_ROLE_CHOICES = ("ProductionWorker", "InventoryManager", "Sales", "Admin")  # workers first
+BIKE_MODELS = tuple(BIKE_TYPE_PARTS)
+PART_NAMES = tuple(INVENTORY_DATA)  # re-derived by Load Data if the parts change
+SIZES = ("Small", "Medium", "Large", "Extra Large")
+COLORS = ("Red", "Blue", "Green", "Black", "White", "Yellow")
+WHEEL_SIZES = ("26 inches", "27.5 inches", "29 inches")
+GEAR_OPTIONS = ("Standard Gears", "Premium Gears")
+BRAKE_OPTIONS = ("Disc Brakes", "Rim Brakes")
+LIGHT_OPTIONS = ("LED Lights", "Standard Lights")
+MAINTENANCE_STATIONS = ("Frame Welding", "Fork Welding", "Painting", "AssemblyLine", "Other")
+
+# Dashboard station rows: (row label, button text, PRODUCTION_STATUS key)
+STATION_BUTTONS = tuple(
+    (f"{text}:", f"Complete {text}", key) for text, key in (
+        ("Frame Welding", "FrameWelded"),
+        ("Fork Welding", "ForkWelded"),
+        ("Front Fork Assembly", "FrontForkAssembly"),
+        ("Painting", "Painting"),
+        ("Pedal Addition", "PedalAddition"),
+        ("Wheel Addition", "WheelAddition"),
+        ("Chain/Gear Installation", "ChainGear"),
+        ("Brake Addition", "BrakeAddition"),
+        ("Light Addition", "LightAddition"),
+        ("Seat Installation", "SeatInstallation")
+    )
+)
+
+# File > Save/Load: the extension picks JSON or the SQLite AppStore
+DATA_FILE_FILTER = "JSON Files (*.json);;SQLite Database (*.db)"
+
+# How long (ms) non-blocking status bar confirmations stay visible
+STATUS_MESSAGE_MS = 3000
+
+# Default column width for all tables (avoids measuring every row's text)
+TABLE_COLUMN_WIDTH = 140
+
+###############################################################################
+# 1A. Data change notifications
+###############################################################################
+class DataSignals(QObject):
+    """
+    Tiny pub/sub hub owned by MainWindow. Code that mutates the global data
+    emits the matching signal so each tab can update just what changed,
+    instead of every tab being rebuilt through refresh_all_tabs().
+    """
+    inventoryChanged = Signal(str)       # part name in INVENTORY_DATA
+    inventoryKeysChanged = Signal()      # parts added/removed (PART_NAMES rebuilt)
+    bikeInventoryChanged = Signal(str)   # bike model in BIKE_INVENTORY
+    productionChanged = Signal(str)      # station key in PRODUCTION_STATUS
+    ordersChanged = Signal(int)          # "order_id" of the changed order
+    recordAdded = Signal(str, int)       # ("maintenance"/"shifts"/"schedule", index)
+    userChanged = Signal(str)            # username added to/removed from USER_DB
+
+
+###############################################################################
+# 1B. Table Model (shared by all the table tabs)
+###############################################################################
+class DictTableModel(QAbstractTableModel):
+    """
+    Read-only model over the global data structures.
+
+    With `keys=None` the source is a dict and each key/value pair is one row
+    (e.g. INVENTORY_DATA). Otherwise the source is a list of records (e.g.
+    PENDING_ORDERS, SHIFTS, MAINTENANCE_RECORDS), used directly rather than
+    copied, and `keys` says what each column shows: a str is an attribute
+    name, an int an index into the record, None leaves the column blank.
+    The tabs change the list themselves and then tell the model
+    (sync_appended(), removing_row()).
+    """
+    # Background for rows matching `highlight` (low stock); built once, not per data() call
+    _HIGHLIGHT_BRUSH = QBrush(QColor(Qt.red))
+
+    def __init__(self, headers, source, keys=None, highlight=None, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._data = source
+        self._highlight = highlight
+        self._getters = None if keys is None else tuple(
+            None if key is None
+            else attrgetter(key) if isinstance(key, str)
+            else itemgetter(key)
+            for key in keys
+        )
+        self._load_rows()
+
+    def _load_rows(self):
+        if self._getters is None:
+            # Dict sources keep only the keys; values are read live in data()
+            self._rows = list(self._data)
+            self._row_of = {key: row for row, key in enumerate(self._rows)}
+        else:
+            self._rows = self._data
+        # Rows the view knows about; a list source may have grown since
+        # (see sync_appended())
+        self._row_count = len(self._rows)
+
+    def refresh(self):
+        """
+        Re-read the source after it has changed wholesale (e.g. Load Data).
+        Only the visible rows are queried again by the view.
+        """
+        self.beginResetModel()
+        self._load_rows()
+        self.endResetModel()
+
+    def refresh_key(self, key):
+        """
+        Repaint only the row for `key` (dict sources). Falls back to a full
+        refresh if the key is new.
+        """
+        row = self._row_of.get(key)
+        if row is None:
+            self.refresh()
+            return
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def refresh_values(self):
+        """Repaint every row after records were replaced in place (same row count)."""
+        if self._row_count:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(self._row_count - 1, self.columnCount() - 1)
+            )
+
+    def sync_appended(self):
+        """
+        Insert rows for records appended to the source list since the view
+        last saw it (e.g. new orders in PENDING_ORDERS); if the list shrank
+        instead, fall back to a full refresh.
+        """
+        count = len(self._rows)
+        if count < self._row_count:
+            self.refresh()
+        elif count > self._row_count:
+            self.beginInsertRows(QModelIndex(), self._row_count, count - 1)
+            self._row_count = count
+            self.endInsertRows()
+
+    @contextmanager
+    def removing_row(self, row):
+        """
+        Wrap the caller's removal of `row` from the source list, so the view
+        drops just that row:
+
+            with model.removing_row(row):
+                del PENDING_ORDERS[row]
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        try:
+            yield
+        finally:
+            self._row_count = len(self._rows)
+            self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+
+        if role == Qt.DisplayRole:
+            if self._getters is None:
+                return row if index.column() == 0 else str(self._data[row])
+            getter = self._getters[index.column()]
+            return getter(row) if getter else None
+
+        if role == Qt.BackgroundRole and self._highlight and self._highlight(row):
+            return self._HIGHLIGHT_BRUSH
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
+class CompleteButtonDelegate(QStyledItemDelegate):
+    """
+    Paints a "Complete" button in each cell of the Pending Orders "Action"
+    column and calls parent().mark_completed(row) when one is clicked, so no
+    per-row QPushButton widgets (or lambda connections) are needed.
+    Without permission the cell just reads "No permission".
+    """
+    def __init__(self, parent, enabled=True):
+        super().__init__(parent)
+        self.enabled = enabled
+
+    def paint(self, painter, option, index):
+        style = QApplication.style()
+        if not self.enabled:
+            style.drawItemText(painter, option.rect, Qt.AlignCenter, option.palette,
+                               False, "No permission")
+            return
+
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = "Complete"
+        button.state = QStyle.State_Enabled
+        style.drawControl(QStyle.CE_PushButton, button, painter)
+
+    def editorEvent(self, event, model, option, index):
+        if (self.enabled and event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton):
+            self.parent().mark_completed(index.row())
+            return True
+        return False
+
+
+@contextmanager
+def batched_table_update(table):
+    """
+    Suspend painting, signals and sorting on `table` while a batch of rows
+    (and their index widgets) is added or removed, so a sortable view is
+    re-sorted and repainted once at the end instead of after every row.
+    """
+    was_sorting = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    table.setSortingEnabled(False)
+    try:
+        yield table
+    finally:
+        table.setSortingEnabled(was_sorting)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+
+
+###############################################################################
+# 1D. SQLite Store (File > Save/Load with a .db file)
+###############################################################################
+class AppStore:
+    """
+    Keeps the factory data in an SQLite database (WAL journal).
+
+    save_all() writes a full snapshot in one transaction and load_all()
+    returns the same shape as a JSON save file. While a database is open,
+    connect_signals() makes every change (inventory, bikes, stations,
+    orders, new maintenance/shift/schedule records and users) a single-row
+    write instead of rewriting the whole file, so nothing is lost if the
+    app closes without another save.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (username TEXT PRIMARY KEY, password TEXT, role TEXT);
+        CREATE TABLE IF NOT EXISTS inventory (name TEXT PRIMARY KEY, qty INTEGER);
+        CREATE TABLE IF NOT EXISTS bike_inventory (model TEXT PRIMARY KEY, qty INTEGER);
+        CREATE TABLE IF NOT EXISTS production (station TEXT PRIMARY KEY, count INTEGER);
+        CREATE TABLE IF NOT EXISTS orders (id INTEGER PRIMARY KEY, status TEXT, json TEXT);
+        CREATE INDEX IF NOT EXISTS orders_status ON orders (status);
+        CREATE TABLE IF NOT EXISTS maintenance (
+            id INTEGER PRIMARY KEY, station TEXT, datetime TEXT, description TEXT
+        );
+        CREATE TABLE IF NOT EXISTS shifts (id INTEGER PRIMARY KEY, json TEXT);
+        CREATE TABLE IF NOT EXISTS schedule (id INTEGER PRIMARY KEY, json TEXT);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Autocommit; multi-row writes open their own transaction
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self._signals = None
+
+    def close(self):
+        self.disconnect_signals()
+        self.conn.close()
+
+    def save_all(self):
+        cur = self.conn.cursor()
+        cur.execute("BEGIN")
+        try:
+            for table in ("users", "inventory", "bike_inventory", "production",
+                          "orders", "maintenance", "shifts", "schedule"):
+                cur.execute(f"DELETE FROM {table}")
+            cur.executemany("INSERT INTO users VALUES (?, ?, ?)",
+                            ((u, pwd, role) for u, (pwd, role) in USER_DB.items()))
+            cur.executemany("INSERT INTO inventory VALUES (?, ?)", INVENTORY_DATA.items())
+            cur.executemany("INSERT INTO bike_inventory VALUES (?, ?)", BIKE_INVENTORY.items())
+            cur.executemany("INSERT INTO production VALUES (?, ?)", PRODUCTION_STATUS.items())
+            cur.executemany("INSERT INTO orders VALUES (?, ?, ?)",
+                            ((o.order_id, o.status, json.dumps(asdict(o))) for o in ORDERS))
+            cur.executemany("INSERT INTO maintenance VALUES (?, ?, ?, ?)",
+                            ((i, *rec) for i, rec in enumerate(MAINTENANCE_RECORDS)))
+            cur.executemany("INSERT INTO shifts VALUES (?, ?)",
+                            ((i, json.dumps(asdict(s))) for i, s in enumerate(SHIFTS)))
+            cur.executemany("INSERT INTO schedule VALUES (?, ?)",
+                            ((i, json.dumps(asdict(s))) for i, s in enumerate(SCHEDULE)))
+            cur.execute("COMMIT")
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+
+    def load_all(self):
+        """
+        Returns the stored data in the same layout as a JSON save file.
+        Sections that are empty in the database are left out, so opening a
+        fresh database does not wipe the user list.
+        """
+        q = self.conn.execute
+        loaded_data = {
+            "inventory": dict(q("SELECT name, qty FROM inventory ORDER BY rowid")),
+            "orders": [json.loads(row[0]) for row in q("SELECT json FROM orders ORDER BY id")],
+            "production": dict(q("SELECT station, count FROM production ORDER BY rowid")),
+            "maintenance": q("SELECT station, datetime, description FROM maintenance ORDER BY id").fetchall(),
+            "shifts": [json.loads(row[0]) for row in q("SELECT json FROM shifts ORDER BY id")],
+            "schedule": [json.loads(row[0]) for row in q("SELECT json FROM schedule ORDER BY id")]
+        }
+        users = {u: (pwd, role) for u, pwd, role
+                 in q("SELECT username, password, role FROM users ORDER BY rowid")}
+        if users:
+            loaded_data["users"] = users
+        bikes = dict(q("SELECT model, qty FROM bike_inventory ORDER BY rowid"))
+        if bikes:
+            loaded_data["bike_inventory"] = bikes
+        return loaded_data
+
+    # Single-row writes, driven by DataSignals
+    def connect_signals(self, signals):
+        self._signals = signals
+        signals.inventoryChanged.connect(self.save_inventory_item)
+        signals.bikeInventoryChanged.connect(self.save_bike_inventory_item)
+        signals.productionChanged.connect(self.save_production_item)
+        signals.ordersChanged.connect(self.save_order)
+        signals.recordAdded.connect(self.save_record)
+        signals.userChanged.connect(self.save_user)
+
+    def disconnect_signals(self):
+        if self._signals is None:
+            return
+        self._signals.inventoryChanged.disconnect(self.save_inventory_item)
+        self._signals.bikeInventoryChanged.disconnect(self.save_bike_inventory_item)
+        self._signals.productionChanged.disconnect(self.save_production_item)
+        self._signals.ordersChanged.disconnect(self.save_order)
+        self._signals.recordAdded.disconnect(self.save_record)
+        self._signals.userChanged.disconnect(self.save_user)
+        self._signals = None
+
+    # Upserts rather than INSERT OR REPLACE: a replace deletes the row and
+    # re-inserts it at the end, which would reorder the rows load_all() reads
+    def save_inventory_item(self, name):
+        self.conn.execute("INSERT INTO inventory VALUES (?, ?) "
+                          "ON CONFLICT(name) DO UPDATE SET qty = excluded.qty",
+                          (name, INVENTORY_DATA[name]))
+
+    def save_bike_inventory_item(self, model):
+        self.conn.execute("INSERT INTO bike_inventory VALUES (?, ?) "
+                          "ON CONFLICT(model) DO UPDATE SET qty = excluded.qty",
+                          (model, BIKE_INVENTORY[model]))
+
+    def save_production_item(self, station):
+        self.conn.execute("INSERT INTO production VALUES (?, ?) "
+                          "ON CONFLICT(station) DO UPDATE SET count = excluded.count",
+                          (station, PRODUCTION_STATUS[station]))
+
+    def save_order(self, order_id):
+        order = ORDERS[order_id]
+        self.conn.execute("INSERT OR REPLACE INTO orders VALUES (?, ?, ?)",
+                          (order_id, order.status, json.dumps(asdict(order))))
+
+    def save_record(self, section, index):
+        # Row ids are list positions, as in save_all()
+        if section == "maintenance":
+            self.conn.execute("INSERT OR REPLACE INTO maintenance VALUES (?, ?, ?, ?)",
+                              (index, *MAINTENANCE_RECORDS[index]))
+            return
+        records = {"shifts": SHIFTS, "schedule": SCHEDULE}[section]
+        self.conn.execute(f"INSERT OR REPLACE INTO {section} VALUES (?, ?)",
+                          (index, json.dumps(asdict(records[index]))))
+
+    def save_user(self, username):
+        if username in USER_DB:
+            self.conn.execute("INSERT INTO users VALUES (?, ?, ?) "
+                              "ON CONFLICT(username) DO UPDATE SET "
+                              "password = excluded.password, role = excluded.role",
+                              (username, *USER_DB[username]))
+        else:
+            self.conn.execute("DELETE FROM users WHERE username = ?", (username,))
+
+
+###############################################################################
+# 1E. Background aggregation for the Reports tab
+###############################################################################
+def aggregate_report_data(inventory, model_counts):
+    """
+    Build the Reports chart data from snapshots of INVENTORY_DATA and
+    ORDER_MODEL_COUNTS. Pure Python with no Qt calls, so it is safe to run on
+    a QThreadPool thread.
+    Returns {"slices": [(label, qty), ...], "model_counts": {model: count}}.
+    """
+    slices = [(f"{component} ({qty})", qty) for component, qty in inventory.items()]
+    return {"slices": slices, "model_counts": model_counts}
+
+
+class AggregateSignals(QObject):
+    """
+    Created on the GUI thread, so emitting `finished` from a pool thread is
+    queued to the GUI thread together with its payload.
+    """
+    finished = Signal(int, object)  # (generation, aggregate_report_data() result)
+
 
 ###############################################################################
 # 2. Login Dialog (Checks USER_DB)
@@ -144,7 +668,7 @@ class LoginDialog(QDialog):
         self.password_edit.setEchoMode(QLineEdit.Password)
 
         self.role_combo = QComboBox()
-        self.role_combo.addItems(["Admin", "ProductionWorker", "InventoryManager", "Sales"])
+        self.role_combo.addItems(ROLE_CHOICES)
 
         form_layout.addRow("Username:", self.username_edit)
         form_layout.addRow("Password:", self.password_edit)
@@ -186,39 +710,48 @@ class MainWindow(QMainWindow):
         self.resize(1600, 800)
 
         self._create_menus()
+        # Success messages on the production path go here instead of a modal popup
+        self.statusBar().showMessage("")
+
+        # Must exist before the tabs, which connect to it in their __init__
+        self.data_signals = DataSignals(self)
+        # Open AppStore once a .db file has been saved or loaded
+        self.store = None
 
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
 
-        # Create each tab/screen
-        self.dashboard_tab = DashboardTab(self, user_role=self.user_role)
-        self.inventory_tab = InventoryTab(self, user_role=self.user_role)
-        self.assembly_tab = BikeAssemblyTab(self, user_role=self.user_role)  # NEW TAB
-        self.order_tab = OrderEntryTab(self, user_role=self.user_role)
-        self.pending_orders_tab = PendingOrdersTab(self, user_role=self.user_role)
-        self.reports_tab = ReportsTab(self, user_role=self.user_role)
-        self.maintenance_tab = MaintenanceTab(self, user_role=self.user_role)
-        self.schedule_tab = ProductionScheduleTab(self, user_role=self.user_role)
-        self.shift_tab = ShiftManagementTab(self, user_role=self.user_role)
-        self.user_management_tab = UserManagementTab(self, user_role=self.user_role)
-
-        self.order_tab.set_pending_orders_tab(self.pending_orders_tab)
-
-        # Add the tabs
-        self.tabs.addTab(self.dashboard_tab, "Dashboard")
-        self.tabs.addTab(self.inventory_tab, "Inventory")
-        self.tabs.addTab(self.assembly_tab, "Bike Assembly")  # Add new Bike Assembly tab
-        self.tabs.addTab(self.order_tab, "Order Entry")
-        self.tabs.addTab(self.pending_orders_tab, "Pending Orders")
-        self.tabs.addTab(self.reports_tab, "Reports")
-        self.tabs.addTab(self.maintenance_tab, "Maintenance")
-        self.tabs.addTab(self.schedule_tab, "Schedule")
-        self.tabs.addTab(self.shift_tab, "Shifts")
-
+        # (attribute, tab class, title, refresh method) for each tab/screen.
+        # Tabs start as empty placeholders and are built the first time they
+        # are shown; until then their attribute is None.
+        self._tab_specs = [
+            ("dashboard_tab", DashboardTab, "Dashboard", "refresh_status"),
+            ("inventory_tab", InventoryTab, "Inventory", "populate_table"),
+            ("assembly_tab", BikeAssemblyTab, "Bike Assembly", "update_bike_inventory_table"),
+            ("order_tab", OrderEntryTab, "Order Entry", None),
+            ("pending_orders_tab", PendingOrdersTab, "Pending Orders", "refresh_table"),
+            ("reports_tab", ReportsTab, "Reports", "refresh_charts"),
+            ("maintenance_tab", MaintenanceTab, "Maintenance", "refresh_maintenance_view"),
+            ("schedule_tab", ProductionScheduleTab, "Schedule", "refresh_schedule_view"),
+            ("shift_tab", ShiftManagementTab, "Shifts", "refresh_shift_view")
+        ]
         if self.user_role in ["Admin", "InventoryManager"]:
-            self.tabs.addTab(self.user_management_tab, "User Management")
+            self._tab_specs.append(
+                ("user_management_tab", UserManagementTab, "User Management", "refresh_user_table")
+            )
+
+        # Indices of built tabs whose data changed while another tab was
+        # showing; each is refreshed when it is next shown
+        self._dirty_tabs = set()
 
-        self.refresh_all_tabs()
+        self._built = []
+        for attr, _, title, _ in self._tab_specs:
+            setattr(self, attr, None)
+            self.tabs.addTab(QWidget(), title)
+            self._built.append(False)
+
+        self.tabs.currentChanged.connect(self._on_current_tab_changed)
+        self._ensure_tab(self.tabs.currentIndex())
 
     def _create_menus(self):
         menubar = self.menuBar()
@@ -241,80 +774,208 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self._show_about_dialog)
         help_menu.addAction(about_action)
 
+    def _ensure_tab(self, index):
+        """
+        Build the real tab at `index` the first time it is shown and swap
+        it in for its placeholder.
+        """
+        if index < 0 or self._built[index]:
+            return
+        attr, tab_class, title, refresh = self._tab_specs[index]
+        tab = tab_class(self, user_role=self.user_role)
+        setattr(self, attr, tab)
+        self._built[index] = True
+        if refresh:
+            getattr(tab, refresh)()
+
+        placeholder = self.tabs.widget(index)
+        # Swapping the current tab would re-enter this slot via currentChanged
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _on_current_tab_changed(self, index):
+        if index < 0:
+            return
+        if not self._built[index]:
+            self._ensure_tab(index)
+            return
+        if index in self._dirty_tabs:
+            self._dirty_tabs.discard(index)
+            attr, _, _, refresh = self._tab_specs[index]
+            getattr(getattr(self, attr), refresh)()
+
+    def mark_tab_dirty(self, tab):
+        """Refresh `tab` the next time it is shown rather than now."""
+        self._dirty_tabs.add(self.tabs.indexOf(tab))
+
     def refresh_all_tabs(self):
-        self.dashboard_tab.update_status_label()
-        self.inventory_tab.populate_table()
-        self.assembly_tab.update_bike_inventory_table()
-        self.pending_orders_tab.refresh_table()
-        self.reports_tab.refresh_charts()
-        self.maintenance_tab.refresh_maintenance_view()
-        self.schedule_tab.refresh_schedule_view()
-        self.shift_tab.refresh_shift_view()
+        current = self.tabs.currentIndex()
+        # Only the visible tab is refreshed now. Tabs that haven't been
+        # built yet will read fresh data when they are
+        for index, ((attr, _, _, refresh), built) in enumerate(zip(self._tab_specs, self._built)):
+            if not built or not refresh:
+                continue
+            if index == current:
+                getattr(getattr(self, attr), refresh)()
+            else:
+                self._dirty_tabs.add(index)
 
-        if self.user_role in ["Admin", "InventoryManager"]:
-            self.user_management_tab.refresh_user_table()
+    def _open_store(self, filename):
+        """
+        Return an AppStore for `filename`: the attached one if it is already
+        open, otherwise a new, not yet attached store. Nothing is written to
+        a new store until _attach_store() is called.
+        """
+        if self.store is not None and self.store.path == filename:
+            return self.store
+        return AppStore(filename)
+
+    def _attach_store(self, store):
+        """
+        Make `store` the current file, so later changes are written to it
+        row by row. Called only once a save or load has succeeded.
+        """
+        if store is self.store:
+            return
+        self._close_store()
+        self.store = store
+        self.store.connect_signals(self.data_signals)
+
+    def _discard_store(self, store):
+        """Close a store opened for a save or load that failed."""
+        if store is not None and store is not self.store:
+            store.close()
+
+    def _close_store(self):
+        """
+        Stop writing changes to the open SQLite store. Used when a JSON file
+        becomes the current file: the database no longer matches the data,
+        and row-by-row writes would land on top of rows from another state.
+        """
+        if self.store is not None:
+            self.store.close()
+            self.store = None
 
     def _save_data(self):
-        filename, _ = QFileDialog.getSaveFileName(self, "Save Data", "", "JSON Files (*.json)")
+        filename, _ = QFileDialog.getSaveFileName(self, "Save Data", "", DATA_FILE_FILTER)
         if not filename:
             return
-        data_to_save = {
-            "users": {k: [v[0], v[1]] for k, v in USER_DB.items()},
-            "inventory": INVENTORY_DATA,
-            "bike_inventory": BIKE_INVENTORY,  # NEW
-            "orders": ORDERS,
-            "production": PRODUCTION_STATUS,
-            "maintenance": list(MAINTENANCE_RECORDS),
-            "shifts": SHIFTS,
-            "schedule": SCHEDULE
-        }
+        store = None
         try:
-            with open(filename, "w") as f:
-                json.dump(data_to_save, f, indent=2)
+            if filename.lower().endswith(".db"):
+                store = self._open_store(filename)
+                store.save_all()
+                self._attach_store(store)
+            else:
+                sections = (
+                    ("users", USER_DB),  # (password, role) tuples are written as JSON lists
+                    ("inventory", INVENTORY_DATA),
+                    ("bike_inventory", BIKE_INVENTORY),  # NEW
+                    ("orders", ORDERS),
+                    ("production", PRODUCTION_STATUS),
+                    ("maintenance", MAINTENANCE_RECORDS),
+                    ("shifts", SHIFTS),
+                    ("schedule", SCHEDULE)
+                )
+                with open(filename, "w") as f:
+                    write_json_sections(f, sections)
+                self._close_store()
             QMessageBox.information(self, "Save Successful", f"Data saved to {filename}")
         except Exception as e:
+            self._discard_store(store)
             QMessageBox.critical(self, "Error Saving", str(e))
 
     def _load_data(self):
-        filename, _ = QFileDialog.getOpenFileName(self, "Load Data", "", "JSON Files (*.json)")
+        global COMPLETED_COUNT, PART_NAMES
+        filename, _ = QFileDialog.getOpenFileName(self, "Load Data", "", DATA_FILE_FILTER)
         if not filename:
             return
+        store = None
         try:
-            with open(filename, "r") as f:
-                loaded_data = json.load(f)
+            if filename.lower().endswith(".db"):
+                store = self._open_store(filename)
+                loaded_data = store.load_all()
+            else:
+                with open(filename, "r") as f:
+                    loaded_data = json.load(f)
 
+            # Parse everything first, so a malformed file leaves the current
+            # data untouched instead of half-replaced
+            users = None
             if "users" in loaded_data:
+                users = {
+                    username: (password, role)
+                    for username, (password, role) in loaded_data["users"].items()
+                }
+            inventory = dict(loaded_data.get("inventory", {}))
+            bike_inventory = None
+            if "bike_inventory" in loaded_data:
+                bike_inventory = dict(loaded_data["bike_inventory"])
+                # Every model can be assembled, so each needs a stock entry
+                for model in BIKE_TYPE_PARTS:
+                    bike_inventory.setdefault(model, 0)
+            # order_id is always the position in ORDERS (older files have none)
+            orders = [
+                _record_from_dict(Order, {**order, "order_id": order_id})
+                for order_id, order in enumerate(loaded_data.get("orders", []))
+            ]
+            production = dict(loaded_data.get("production", {}))
+            maintenance = list(loaded_data.get("maintenance", []))
+            shifts = [_record_from_dict(Shift, shift) for shift in loaded_data.get("shifts", [])]
+            schedule = [
+                _record_from_dict(ScheduleEntry, entry) for entry in loaded_data.get("schedule", [])
+            ]
+
+            # Only now does the loaded file become the current one
+            if store is not None:
+                self._attach_store(store)
+            else:
+                self._close_store()
+
+            if users is not None:
                 USER_DB.clear()
-                for username, (password, role) in loaded_data["users"].items():
-                    USER_DB[username] = (password, role)
+                USER_DB.update(users)
 
             INVENTORY_DATA.clear()
-            INVENTORY_DATA.update(loaded_data.get("inventory", {}))
+            INVENTORY_DATA.update(inventory)
+
+            parts_changed = tuple(INVENTORY_DATA) != PART_NAMES
+            if parts_changed:
+                PART_NAMES = tuple(INVENTORY_DATA)
 
             # Load the completed bike inventory
-            if "bike_inventory" in loaded_data:
+            if bike_inventory is not None:
                 BIKE_INVENTORY.clear()
-                BIKE_INVENTORY.update(loaded_data["bike_inventory"])
+                BIKE_INVENTORY.update(bike_inventory)
 
-            ORDERS.clear()
-            ORDERS.extend(loaded_data.get("orders", []))
+            ORDERS[:] = orders
 
-            PRODUCTION_STATUS.clear()
-            PRODUCTION_STATUS.update(loaded_data.get("production", {}))
+            PENDING_ORDERS[:] = [o for o in ORDERS if o.status == "Pending"]
+            COMPLETED_COUNT = sum(1 for o in ORDERS if o.status == "Completed")
+            ORDER_MODEL_COUNTS.clear()
+            ORDER_MODEL_COUNTS.update(o.bike_model for o in ORDERS)
 
-            MAINTENANCE_RECORDS.clear()
-            for rec in loaded_data.get("maintenance", []):
-                MAINTENANCE_RECORDS.append(tuple(rec))
+            PRODUCTION_STATUS.clear()
+            PRODUCTION_STATUS.update(production)
 
-            SHIFTS.clear()
-            SHIFTS.extend(loaded_data.get("shifts", []))
+            # Records come back as lists; everything that reads them just unpacks
+            MAINTENANCE_RECORDS[:] = maintenance
+            SHIFTS[:] = shifts
+            SCHEDULE[:] = schedule
 
-            SCHEDULE.clear()
-            SCHEDULE.extend(loaded_data.get("schedule", []))
+            for name in DATA_VERSIONS:
+                DATA_VERSIONS[name] += 1
 
+            if parts_changed:
+                self.data_signals.inventoryKeysChanged.emit()
             self.refresh_all_tabs()
             QMessageBox.information(self, "Load Successful", f"Data loaded from {filename}")
         except Exception as e:
+            self._discard_store(store)
             QMessageBox.critical(self, "Error Loading", str(e))
 
     def _show_about_dialog(self):
@@ -351,28 +1012,30 @@ class DashboardTab(QWidget):
 
         # A label to show “Production Status” + “Orders” + “Bike Inventory”
         self.status_label = QLabel()
+        self._last_versions = None
+        self.build_status_template()
         layout.addWidget(self.status_label)
 
         self.setLayout(layout)
 
+        signals = self.main_window.data_signals
+        signals.bikeInventoryChanged.connect(self._data_changed)
+        signals.ordersChanged.connect(self._data_changed)
+
+    def _data_changed(self, *_):
+        # While hidden, the template may be stale (Load Data only marks this
+        # tab dirty), so leave the update to refresh_status() when shown
+        if self.main_window.tabs.currentWidget() is self:
+            self.update_status_label()
+        else:
+            self.main_window.mark_tab_dirty(self)
+
     def _create_station_buttons(self, parent_layout):
-        station_list = [
-            ("Frame Welding", "FrameWelded"),
-            ("Fork Welding", "ForkWelded"),
-            ("Front Fork Assembly", "FrontForkAssembly"),
-            ("Painting", "Painting"),
-            ("Pedal Addition", "PedalAddition"),
-            ("Wheel Addition", "WheelAddition"),
-            ("Chain/Gear Installation", "ChainGear"),
-            ("Brake Addition", "BrakeAddition"),
-            ("Light Addition", "LightAddition"),
-            ("Seat Installation", "SeatInstallation")
-        ]
-        for station_text, station_key in station_list:
+        for label_text, button_text, station_key in STATION_BUTTONS:
             row_layout = QHBoxLayout()
-            label = QLabel(station_text + ":")
-            btn = QPushButton(f"Complete {station_text}")
-            btn.clicked.connect(lambda _, key=station_key: self.record_station_completion(key))
+            label = QLabel(label_text)
+            btn = QPushButton(button_text)
+            btn.clicked.connect(functools.partial(self.record_station_completion, station_key))
             row_layout.addWidget(label)
             row_layout.addWidget(btn)
             parent_layout.addLayout(row_layout)
@@ -380,80 +1043,101 @@ class DashboardTab(QWidget):
     def record_station_completion(self, station_key):
         """
         Deducts resources or prior station completions from STATION_REQUIREMENTS,
-        updates PRODUCTION_STATUS, then refreshes the entire UI.
+        updates PRODUCTION_STATUS, then notifies only what changed.
         """
-        from PySide6.QtWidgets import QMessageBox
-        requirements = STATION_REQUIREMENTS.get(station_key, {})
+        requirements = COMPILED_STATION_REQS.get(station_key, ())
 
         # Check requirements
-        for req_key, req_amount in requirements.items():
-            if req_key in INVENTORY_DATA:
-                if INVENTORY_DATA[req_key] < req_amount:
+        for source, req_key, req_amount in requirements:
+            have = source.get(req_key, 0)
+            if have < req_amount:
+                if source is INVENTORY_DATA:
                     QMessageBox.warning(
                         self, "Not Enough Inventory",
                         f"Station '{station_key}' requires {req_amount} of '{req_key}'. "
-                        f"Only {INVENTORY_DATA[req_key]} available."
+                        f"Only {have} available."
                     )
-                    return
-            elif req_key in PRODUCTION_STATUS:
-                if PRODUCTION_STATUS[req_key] < req_amount:
+                else:
                     QMessageBox.warning(
                         self, "Not Enough Components",
                         f"Station '{station_key}' requires {req_amount} from prior station '{req_key}'. "
-                        f"Only {PRODUCTION_STATUS[req_key]} available."
+                        f"Only {have} available."
                     )
-                    return
-            else:
-                QMessageBox.warning(
-                    self, "Unknown Requirement",
-                    f"Could not find resource or station '{req_key}' in this system."
-                )
                 return
 
+        # Bump the versions before emitting, so listeners see the new ones
+        DATA_VERSIONS["inventory"] += 1
+        DATA_VERSIONS["production"] += 1
+
         # Deduct them
-        for req_key, req_amount in requirements.items():
-            if req_key in INVENTORY_DATA:
-                INVENTORY_DATA[req_key] -= req_amount
+        signals = self.main_window.data_signals
+        for source, req_key, req_amount in requirements:
+            source[req_key] -= req_amount
+            if source is INVENTORY_DATA:
+                signals.inventoryChanged.emit(req_key)
             else:
-                PRODUCTION_STATUS[req_key] -= req_amount
+                signals.productionChanged.emit(req_key)
 
         PRODUCTION_STATUS[station_key] += 1
+        signals.productionChanged.emit(station_key)
 
-        # Refresh everything, including the Dashboard
-        self.main_window.refresh_all_tabs()
+        # Production counts only live on the Dashboard
+        self.update_status_label()
+
+    def refresh_status(self):
+        """
+        Full refresh (start-up / Load Data): station or bike model names
+        may have changed, so rebuild the template first.
+        """
+        self.build_status_template()
+        self.update_status_label()
 
     def update_status_label(self):
         """
-        Called by refresh_all_tabs(). We’ll build a multi-section string showing:
+        Called via refresh_status() and the data signals. We’ll build a multi-section string showing:
          - Production station counts
          - Orders (pending vs completed)
          - Assembled bikes in BIKE_INVENTORY
+        Skipped entirely when none of that data has changed since last time.
         """
-        # Production status lines
-        prod_lines = ["Production Station Counts:"]
-        for station, count in PRODUCTION_STATUS.items():
-            prod_lines.append(f"  - {station}: {count}")
-
-        # Orders summary
-        total_orders = len(ORDERS)
-        pending = sum(1 for o in ORDERS if o.get("status") == "Pending")
-        completed = sum(1 for o in ORDERS if o.get("status") == "Completed")
-        order_lines = [
-            "\nOrder Summary:",
-            f"  - Total Orders: {total_orders}",
-            f"  - Pending: {pending}",
-            f"  - Completed: {completed}"
-        ]
-
-        # Bike inventory summary
-        bike_inv_lines = ["\nAssembled Bikes in Inventory:"]
-        for model, qty in BIKE_INVENTORY.items():
-            bike_inv_lines.append(f"  - {model}: {qty}")
+        versions = (
+            DATA_VERSIONS["production"],
+            DATA_VERSIONS["orders"],
+            DATA_VERSIONS["bike_inventory"]
+        )
+        if versions == self._last_versions:
+            return
+        self._last_versions = versions
 
-        # Combine them
-        final_text = "\n".join(prod_lines + order_lines + bike_inv_lines)
+        final_text = self._template.format(
+            *PRODUCTION_STATUS.values(),
+            len(ORDERS), len(PENDING_ORDERS), COMPLETED_COUNT,
+            *BIKE_INVENTORY.values()
+        )
         self.status_label.setText(final_text)
 
+    def build_status_template(self):
+        """
+        Pre-build the status text with a {} slot per number, so an update is
+        a single str.format() call. Must be rebuilt if the station or bike
+        model names change.
+        """
+        def line(name):
+            name = str(name).replace("{", "{{").replace("}", "}}")
+            return f"  - {name}: {{}}"
+
+        self._template = "\n".join([
+            "Production Station Counts:",
+            *(line(station) for station in PRODUCTION_STATUS),
+            "\nOrder Summary:",
+            "  - Total Orders: {}",
+            "  - Pending: {}",
+            "  - Completed: {}",
+            "\nAssembled Bikes in Inventory:",
+            *(line(model) for model in BIKE_INVENTORY)
+        ])
+        self._last_versions = None
+
 
 ###############################################################################
 # 5. Inventory Tab
@@ -470,18 +1154,22 @@ class InventoryTab(QWidget):
         table_label.setStyleSheet("font-size: 16px; font-weight: bold;")
         main_layout.addWidget(table_label)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["Component", "Quantity"])
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # Rows with 3 or fewer parts left are highlighted in red
+        self.model = DictTableModel(
+            ["Component", "Quantity"], INVENTORY_DATA,
+            highlight=lambda comp: INVENTORY_DATA[comp] <= 3
+        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setDefaultSectionSize(TABLE_COLUMN_WIDTH)
         main_layout.addWidget(self.table)
 
         # If manager or admin, allow replenishing
         if self.user_role in ["Admin", "InventoryManager"]:
             replenish_layout = QHBoxLayout()
             self.component_combo = QComboBox()
-            for comp in INVENTORY_DATA:
-                self.component_combo.addItem(comp)
+            self.component_combo.addItems(PART_NAMES)
             self.replenish_spin = QSpinBox()
             self.replenish_spin.setRange(1, 1000)
             self.add_stock_button = QPushButton("Add/Replenish Stock")
@@ -495,24 +1183,26 @@ class InventoryTab(QWidget):
 
         self.setLayout(main_layout)
 
+        signals = self.main_window.data_signals
+        signals.inventoryChanged.connect(self.model.refresh_key)
+        if self.user_role in ["Admin", "InventoryManager"]:
+            signals.inventoryKeysChanged.connect(self._rebuild_component_combo)
+
+    def _rebuild_component_combo(self):
+        current = self.component_combo.currentText()
+        self.component_combo.clear()
+        self.component_combo.addItems(PART_NAMES)
+        self.component_combo.setCurrentText(current)
+
     def populate_table(self):
-        self.table.setRowCount(len(INVENTORY_DATA))
-        for row, (comp, qty) in enumerate(INVENTORY_DATA.items()):
-            comp_item = QTableWidgetItem(comp)
-            qty_item = QTableWidgetItem(str(qty))
-            if qty <= 3:
-                comp_item.setBackground(Qt.red)
-                qty_item.setBackground(Qt.red)
-            self.table.setItem(row, 0, comp_item)
-            self.table.setItem(row, 1, qty_item)
-
-        self.table.resizeColumnsToContents()
+        self.model.refresh()
 
     def replenish_stock(self):
         comp = self.component_combo.currentText()
         amount = self.replenish_spin.value()
         INVENTORY_DATA[comp] += amount
-        self.main_window.refresh_all_tabs()
+        DATA_VERSIONS["inventory"] += 1
+        self.main_window.data_signals.inventoryChanged.emit(comp)
 
 
 ###############################################################################
@@ -536,10 +1226,11 @@ class BikeAssemblyTab(QWidget):
         layout.addWidget(lbl_header)
 
         # Table that shows how many fully built bikes we have for each model
-        self.bike_table = QTableWidget()
-        self.bike_table.setColumnCount(2)
-        self.bike_table.setHorizontalHeaderLabels(["Bike Model", "Quantity"])
-        self.bike_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.bike_model = DictTableModel(["Bike Model", "Quantity"], BIKE_INVENTORY)
+        self.bike_table = QTableView()
+        self.bike_table.setModel(self.bike_model)
+        self.bike_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.bike_table.horizontalHeader().setDefaultSectionSize(TABLE_COLUMN_WIDTH)
         layout.addWidget(self.bike_table)
 
         # If manager or admin or production worker want to build bikes?
@@ -547,8 +1238,7 @@ class BikeAssemblyTab(QWidget):
         if self.user_role in ["Admin", "ProductionWorker"]:
             assembly_layout = QHBoxLayout()
             self.assemble_model_combo = QComboBox()
-            for bike_type in BIKE_TYPE_PARTS.keys():
-                self.assemble_model_combo.addItem(bike_type)
+            self.assemble_model_combo.addItems(BIKE_MODELS)
 
             self.assemble_button = QPushButton("Assemble Bike")
             self.assemble_button.clicked.connect(self.assemble_bike)
@@ -563,19 +1253,13 @@ class BikeAssemblyTab(QWidget):
 
         self.setLayout(layout)
 
+        self.main_window.data_signals.bikeInventoryChanged.connect(self.bike_model.refresh_key)
+
     def update_bike_inventory_table(self):
         """
         Show how many of each bike type are in BIKE_INVENTORY.
         """
-        self.bike_table.setRowCount(len(BIKE_INVENTORY))
-        row = 0
-        for model, qty in BIKE_INVENTORY.items():
-            model_item = QTableWidgetItem(model)
-            qty_item = QTableWidgetItem(str(qty))
-            self.bike_table.setItem(row, 0, model_item)
-            self.bike_table.setItem(row, 1, qty_item)
-            row += 1
-        self.bike_table.resizeColumnsToContents()
+        self.bike_model.refresh()
 
     def assemble_bike(self):
         """
@@ -584,30 +1268,36 @@ class BikeAssemblyTab(QWidget):
         BIKE_INVENTORY for that model by 1.
         """
         model = self.assemble_model_combo.currentText()
-        if model not in BIKE_TYPE_PARTS:
+        recipe = COMPILED_BIKE_RECIPES.get(model)
+        if recipe is None:
             QMessageBox.warning(self, "Error", f"No parts recipe found for {model}")
             return
 
         # Check parts availability
-        recipe = BIKE_TYPE_PARTS[model]
-        for part, needed in recipe.items():
-            have = INVENTORY_DATA.get(part, 0)
+        for parts, part, needed in recipe:
+            have = parts.get(part, 0)
             if have < needed:
                 QMessageBox.warning(self, "Not Enough Parts",
                                     f"Need {needed} of '{part}' for {model}, only {have} available.")
                 return
 
+        # Bump the versions before emitting, so listeners see the new ones
+        DATA_VERSIONS["inventory"] += 1
+        DATA_VERSIONS["bike_inventory"] += 1
+
         # Deduct the parts
-        for part, needed in recipe.items():
-            INVENTORY_DATA[part] -= needed
+        signals = self.main_window.data_signals
+        for parts, part, needed in recipe:
+            parts[part] -= needed
+            signals.inventoryChanged.emit(part)
 
         # Add to the BIKE_INVENTORY
         BIKE_INVENTORY[model] += 1
+        signals.bikeInventoryChanged.emit(model)
 
-        QMessageBox.information(self, "Assembled",
-                                f"One '{model}' bike assembled and added to bike inventory.")
-
-        self.main_window.refresh_all_tabs()
+        self.main_window.statusBar().showMessage(
+            f"One '{model}' bike assembled and added to bike inventory.", STATUS_MESSAGE_MS
+        )
 
 
 ###############################################################################
@@ -618,7 +1308,6 @@ class OrderEntryTab(QWidget):
         super().__init__()
         self.main_window = main_window
         self.user_role = user_role
-        self.pending_orders_tab = None
 
         layout = QVBoxLayout()
         form_layout = QFormLayout()
@@ -628,25 +1317,25 @@ class OrderEntryTab(QWidget):
         self.delivery_address_input = QLineEdit()
 
         self.bike_model_combo = QComboBox()
-        self.bike_model_combo.addItems(BIKE_TYPE_PARTS.keys())
+        self.bike_model_combo.addItems(BIKE_MODELS)
 
         self.bike_size_combo = QComboBox()
-        self.bike_size_combo.addItems(["Small", "Medium", "Large", "Extra Large"])
+        self.bike_size_combo.addItems(SIZES)
 
         self.bike_color_combo = QComboBox()
-        self.bike_color_combo.addItems(["Red", "Blue", "Green", "Black", "White", "Yellow"])
+        self.bike_color_combo.addItems(COLORS)
 
         self.bike_wheels_combo = QComboBox()
-        self.bike_wheels_combo.addItems(["26 inches", "27.5 inches", "29 inches"])
+        self.bike_wheels_combo.addItems(WHEEL_SIZES)
 
         self.gears_combo = QComboBox()
-        self.gears_combo.addItems(["Standard Gears", "Premium Gears"])
+        self.gears_combo.addItems(GEAR_OPTIONS)
 
         self.brakes_combo = QComboBox()
-        self.brakes_combo.addItems(["Disc Brakes", "Rim Brakes"])
+        self.brakes_combo.addItems(BRAKE_OPTIONS)
 
         self.lights_combo = QComboBox()
-        self.lights_combo.addItems(["LED Lights", "Standard Lights"])
+        self.lights_combo.addItems(LIGHT_OPTIONS)
 
         form_layout.addRow("Customer Name:", self.customer_name_input)
         form_layout.addRow("Contact Info:", self.contact_info_input)
@@ -670,35 +1359,32 @@ class OrderEntryTab(QWidget):
 
         self.setLayout(layout)
 
-    def set_pending_orders_tab(self, pending_tab):
-        self.pending_orders_tab = pending_tab
-
     def submit_order(self):
-        new_order = {
-            "customer_name": self.customer_name_input.text(),
-            "contact_info": self.contact_info_input.text(),
-            "delivery_address": self.delivery_address_input.text(),
-            "bike_model": self.bike_model_combo.currentText(),
-            "bike_size": self.bike_size_combo.currentText(),
-            "bike_color": self.bike_color_combo.currentText(),
-            "wheel_size": self.bike_wheels_combo.currentText(),
-            "gears": self.gears_combo.currentText(),
-            "brakes": self.brakes_combo.currentText(),
-            "lights": self.lights_combo.currentText(),
-            "status": "Pending"
-        }
+        new_order = Order(
+            order_id=len(ORDERS),
+            customer_name=self.customer_name_input.text(),
+            contact_info=self.contact_info_input.text(),
+            delivery_address=self.delivery_address_input.text(),
+            bike_model=self.bike_model_combo.currentText(),
+            bike_size=self.bike_size_combo.currentText(),
+            bike_color=self.bike_color_combo.currentText(),
+            wheel_size=self.bike_wheels_combo.currentText(),
+            gears=self.gears_combo.currentText(),
+            brakes=self.brakes_combo.currentText(),
+            lights=self.lights_combo.currentText()
+        )
         ORDERS.append(new_order)
+        PENDING_ORDERS.append(new_order)
+        ORDER_MODEL_COUNTS[new_order.bike_model] += 1
+        DATA_VERSIONS["orders"] += 1
 
         self.customer_name_input.clear()
         self.contact_info_input.clear()
         self.delivery_address_input.clear()
 
-        QMessageBox.information(self, "Order Submitted", "Order has been recorded.")
-
-        if self.pending_orders_tab:
-            self.pending_orders_tab.refresh_table()
+        self.main_window.statusBar().showMessage("Order has been recorded.", STATUS_MESSAGE_MS)
 
-        self.main_window.refresh_all_tabs()
+        self.main_window.data_signals.ordersChanged.emit(new_order.order_id)
 
 
 ###############################################################################
@@ -716,38 +1402,31 @@ class PendingOrdersTab(QWidget):
         self.title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
         self.layout.addWidget(self.title_label)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["Customer", "Model", "Size", "Color", "Status", "Action"])
+        self.model = DictTableModel(
+            ["Customer", "Model", "Size", "Color", "Status", "Action"],
+            PENDING_ORDERS,
+            keys=["customer_name", "bike_model", "bike_size", "bike_color", "status", None]
+        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setDefaultSectionSize(TABLE_COLUMN_WIDTH)
+        self.complete_delegate = CompleteButtonDelegate(
+            self, enabled=self.user_role in ["Admin", "ProductionWorker"]
+        )
+        self.table.setItemDelegateForColumn(5, self.complete_delegate)
         self.layout.addWidget(self.table)
 
         self.setLayout(self.layout)
-        self.refresh_table()
+
+        self.main_window.data_signals.ordersChanged.connect(self._order_changed)
 
     def refresh_table(self):
-        pending_orders = [o for o in ORDERS if o.get("status") == "Pending"]
-        self.table.setRowCount(len(pending_orders))
-        for row, order in enumerate(pending_orders):
-            c_item = QTableWidgetItem(order.get("customer_name", ""))
-            m_item = QTableWidgetItem(order.get("bike_model", ""))
-            s_item = QTableWidgetItem(order.get("bike_size", ""))
-            c2_item = QTableWidgetItem(order.get("bike_color", ""))
-            st_item = QTableWidgetItem(order.get("status", ""))
-
-            self.table.setItem(row, 0, c_item)
-            self.table.setItem(row, 1, m_item)
-            self.table.setItem(row, 2, s_item)
-            self.table.setItem(row, 3, c2_item)
-            self.table.setItem(row, 4, st_item)
-
-            if self.user_role in ["Admin", "ProductionWorker"]:
-                complete_btn = QPushButton("Complete")
-                complete_btn.clicked.connect(lambda checked, r=row: self.mark_completed(r))
-                self.table.setCellWidget(row, 5, complete_btn)
-            else:
-                self.table.setCellWidget(row, 5, QLabel("No permission"))
+        self.model.refresh()
 
-        self.table.resizeColumnsToContents()
+    def _order_changed(self, order_id):
+        # Completions remove their own row in mark_completed(); new orders are
+        # appended to PENDING_ORDERS by the Order Entry tab
+        self.model.sync_appended()
 
     def mark_completed(self, row_index):
         """
@@ -755,27 +1434,37 @@ class PendingOrdersTab(QWidget):
         pre-assembled bike in BIKE_INVENTORY for that model.
         If not, we can't complete the order.
         """
-        pending_orders = [o for o in ORDERS if o.get("status") == "Pending"]
-        if row_index < len(pending_orders):
-            order = pending_orders[row_index]
-            model = order["bike_model"]
-            have = BIKE_INVENTORY.get(model, 0)
-            if have < 1:
-                QMessageBox.warning(
-                    self, "No Pre‐Assembled Bikes",
-                    f"No assembled '{model}' bikes available in Bike Inventory.\n"
-                    f"Assemble more in the Bike Assembly tab."
-                )
-                return
-            # Otherwise, we have at least 1 bike of that type -> remove it
-            BIKE_INVENTORY[model] -= 1
-            order["status"] = "Completed"
-            QMessageBox.information(
-                self, "Order Completed",
-                f"Order for {order.get('customer_name','')} is now Completed.\n"
-                f"One '{model}' bike removed from Bike Inventory."
+        global COMPLETED_COUNT
+        if row_index >= len(PENDING_ORDERS):
+            return
+
+        # Row i of the table is PENDING_ORDERS[i], so no scan of ORDERS
+        order = PENDING_ORDERS[row_index]
+        model = order.bike_model
+        have = BIKE_INVENTORY.get(model, 0)  # a loaded file may lack the model
+        if have < 1:
+            QMessageBox.warning(
+                self, "No Pre‐Assembled Bikes",
+                f"No assembled '{model}' bikes available in Bike Inventory.\n"
+                f"Assemble more in the Bike Assembly tab."
             )
-            self.main_window.refresh_all_tabs()
+            return
+        # Otherwise, we have at least 1 bike of that type -> remove it
+        BIKE_INVENTORY[model] = have - 1
+        with self.model.removing_row(row_index):
+            del PENDING_ORDERS[row_index]
+        order.status = "Completed"
+        COMPLETED_COUNT += 1
+        DATA_VERSIONS["bike_inventory"] += 1
+        DATA_VERSIONS["orders"] += 1
+        self.main_window.statusBar().showMessage(
+            f"Order for {order.customer_name} is now Completed. "
+            f"One '{model}' bike removed from Bike Inventory.",
+            STATUS_MESSAGE_MS
+        )
+        signals = self.main_window.data_signals
+        signals.bikeInventoryChanged.emit(model)
+        signals.ordersChanged.emit(order.order_id)
 
 
 ###############################################################################
@@ -792,69 +1481,105 @@ class ReportsTab(QWidget):
         title.setStyleSheet("font-size: 16px; font-weight: bold;")
         self.layout.addWidget(title)
 
-        self.inventory_chart_view = None
-        self.orders_chart_view = None
+        # The charts, series and axis are built once; refresh_charts() only
+        # swaps the data held by the series
+        self.inventory_chart_view = self.create_inventory_pie_chart()
+        self.orders_chart_view = self.create_orders_bar_chart()
+        self.layout.addWidget(self.inventory_chart_view)
+        self.layout.addWidget(self.orders_chart_view)
+
+        # aggregate_report_data() runs on the thread pool; only the result
+        # of the newest refresh is drawn
+        self._generation = 0
+        self._aggregate_signals = AggregateSignals(self)
+        self._aggregate_signals.finished.connect(self._apply_aggregates)
+        # DATA_VERSIONS the charts were last built from; unchanged means no work
+        self._last_versions = None
 
         self.setLayout(self.layout)
-        self.refresh_charts()
+
+        signals = self.main_window.data_signals
+        signals.inventoryChanged.connect(self._data_changed)
+        signals.ordersChanged.connect(self._data_changed)
+
+    def _data_changed(self, *_):
+        if self.main_window.tabs.currentWidget() is self:
+            self.refresh_charts()
+        else:
+            self.main_window.mark_tab_dirty(self)
+
+    def clear_cache(self):
+        """Make the next refresh_charts() rebuild the charts even if no version changed."""
+        self._last_versions = None
 
     def refresh_charts(self):
-        if self.inventory_chart_view:
-            self.layout.removeWidget(self.inventory_chart_view)
-            self.inventory_chart_view.deleteLater()
+        versions = (DATA_VERSIONS["inventory"], DATA_VERSIONS["orders"])
+        if versions == self._last_versions:
+            return
+        self._last_versions = versions
+
+        # Copies, so the worker never iterates a dict the GUI thread is changing
+        self._generation += 1
+        QThreadPool.globalInstance().start(functools.partial(
+            self._aggregate, self._generation, dict(INVENTORY_DATA), dict(ORDER_MODEL_COUNTS)
+        ))
+
+    def _aggregate(self, generation, inventory, model_counts):
+        # Worker thread: no Qt calls apart from the emit, which Qt queues to the GUI thread
+        self._aggregate_signals.finished.emit(
+            generation, aggregate_report_data(inventory, model_counts)
+        )
 
-        if self.orders_chart_view:
-            self.layout.removeWidget(self.orders_chart_view)
-            self.orders_chart_view.deleteLater()
+    def _apply_aggregates(self, generation, result):
+        if generation != self._generation:
+            return  # a newer refresh is already on its way
 
-        self.inventory_chart_view = self.create_inventory_pie_chart()
-        self.orders_chart_view = self.create_orders_bar_chart()
+        self.pie_series.clear()
+        for label, qty in result["slices"]:
+            self.pie_series.append(label, qty)
 
-        self.layout.addWidget(self.inventory_chart_view)
-        self.layout.addWidget(self.orders_chart_view)
+        model_counts = result["model_counts"]
+        self.bar_set.remove(0, self.bar_set.count())
+        # One call for all the values instead of one per model
+        self.bar_set.append(list(model_counts.values()))
 
-    def create_inventory_pie_chart(self):
-        from PySide6.QtCharts import QPieSeries, QChart, QChartView
+        # The axes were attached while the chart was empty, so their ranges
+        # have to follow the data by hand
+        self.axisX.setCategories(list(model_counts))
+        self.axisY.setRange(0, max(model_counts.values(), default=1))
 
-        series = QPieSeries()
-        for component, qty in INVENTORY_DATA.items():
-            series.append(f"{component} ({qty})", qty)
+    def create_inventory_pie_chart(self):
+        self.pie_series = QPieSeries()
 
         chart = QChart()
-        chart.addSeries(series)
+        chart.addSeries(self.pie_series)
         chart.setTitle("Current Parts Inventory Distribution")
+        chart.setAnimationOptions(QChart.NoAnimation)
 
         chart_view = QChartView(chart)
         return chart_view
 
     def create_orders_bar_chart(self):
-        from PySide6.QtCharts import QBarSeries, QBarSet, QChart, QChartView, QCategoryAxis
-        model_counts = defaultdict(int)
-        for order in ORDERS:
-            model_counts[order["bike_model"]] += 1
-
-        set_orders = QBarSet("Orders by Model")
-        categories = []
-        for model, count in model_counts.items():
-            set_orders.append(count)
-            categories.append(model)
-
+        self.bar_set = QBarSet("Orders by Model")
         series = QBarSeries()
-        series.append(set_orders)
+        series.append(self.bar_set)
 
         chart = QChart()
         chart.addSeries(series)
         chart.setTitle("Orders by Bike Model")
-        chart.setAnimationOptions(QChart.SeriesAnimations)
+        # Refreshes only change the data; animating each change only costs time
+        chart.setAnimationOptions(QChart.NoAnimation)
 
-        axisX = QCategoryAxis()
-        for i, cat in enumerate(categories):
-            axisX.append(cat, i)
-        chart.addAxis(axisX, Qt.AlignBottom)
-        series.attachAxis(axisX)
+        self.axisX = QBarCategoryAxis()
+        chart.addAxis(self.axisX, Qt.AlignBottom)
+        series.attachAxis(self.axisX)
 
-        chart_view = QChartView(chart)
-        return chart_view
+        self.axisY = QValueAxis()
+        self.axisY.setLabelFormat("%d")
+        chart.addAxis(self.axisY, Qt.AlignLeft)
+        series.attachAxis(self.axisY)
+
+        return QChartView(chart)
 
 
 ###############################################################################
@@ -871,15 +1596,22 @@ class MaintenanceTab(QWidget):
         title.setStyleSheet("font-size: 16px; font-weight: bold;")
         layout.addWidget(title)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Station", "Date/Time", "Description"])
+        self.model = DictTableModel(
+            ["Station", "Date/Time", "Description"], MAINTENANCE_RECORDS, keys=(0, 1, 2)
+        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # Fixed widths, so adding a row never re-measures the whole column
+        header = self.table.horizontalHeader()
+        header.setDefaultSectionSize(TABLE_COLUMN_WIDTH)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)  # Description
         layout.addWidget(self.table)
 
         if self.user_role in ["Admin", "InventoryManager"]:
             form_layout = QFormLayout()
             self.station_combo = QComboBox()
-            self.station_combo.addItems(["Frame Welding", "Fork Welding", "Painting", "AssemblyLine", "Other"])
+            self.station_combo.addItems(MAINTENANCE_STATIONS)
             self.maint_datetime = QDateTimeEdit()
             self.maint_datetime.setDateTime(QDateTime.currentDateTime())
             self.maint_desc = QLineEdit()
@@ -895,24 +1627,19 @@ class MaintenanceTab(QWidget):
             layout.addWidget(btn)
 
         self.setLayout(layout)
-        self.refresh_maintenance_view()
 
     def refresh_maintenance_view(self):
-        self.table.setRowCount(len(MAINTENANCE_RECORDS))
-        for row, (station, date_str, desc) in enumerate(MAINTENANCE_RECORDS):
-            self.table.setItem(row, 0, QTableWidgetItem(station))
-            self.table.setItem(row, 1, QTableWidgetItem(date_str))
-            self.table.setItem(row, 2, QTableWidgetItem(desc))
-        self.table.resizeColumnsToContents()
+        self.model.refresh()
 
     def add_record(self):
         station = self.station_combo.currentText()
-        date_str = self.maint_datetime.dateTime().toString(Qt.DefaultLocaleShortDate)
+        date_str = self.maint_datetime.dateTime().toString(Qt.ISODate)
         desc = self.maint_desc.text().strip()
         MAINTENANCE_RECORDS.append((station, date_str, desc))
+        self.model.sync_appended()
+        self.main_window.data_signals.recordAdded.emit("maintenance", len(MAINTENANCE_RECORDS) - 1)
         QMessageBox.information(self, "Record Added", "Maintenance record added.")
         self.maint_desc.clear()
-        self.main_window.refresh_all_tabs()
 
 
 ###############################################################################
@@ -929,9 +1656,17 @@ class ProductionScheduleTab(QWidget):
         title.setStyleSheet("font-size: 16px; font-weight: bold;")
         layout.addWidget(title)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Date/Time", "Task", "Notes"])
+        self.model = DictTableModel(
+            ["Date/Time", "Task", "Notes"], SCHEDULE,
+            keys=("datetime", "task", "notes")
+        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # Fixed widths, so adding a row never re-measures the whole column
+        header = self.table.horizontalHeader()
+        header.setDefaultSectionSize(TABLE_COLUMN_WIDTH)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)  # Notes
         layout.addWidget(self.table)
 
         if self.user_role in ["Admin", "ProductionWorker"]:
@@ -951,29 +1686,21 @@ class ProductionScheduleTab(QWidget):
             layout.addWidget(add_btn)
 
         self.setLayout(layout)
-        self.refresh_schedule_view()
 
     def refresh_schedule_view(self):
-        self.table.setRowCount(len(SCHEDULE))
-        for row, item in enumerate(SCHEDULE):
-            dt_str = item.get("datetime", "")
-            task_str = item.get("task", "")
-            notes_str = item.get("notes", "")
-            self.table.setItem(row, 0, QTableWidgetItem(dt_str))
-            self.table.setItem(row, 1, QTableWidgetItem(task_str))
-            self.table.setItem(row, 2, QTableWidgetItem(notes_str))
-        self.table.resizeColumnsToContents()
+        self.model.refresh()
 
     def add_schedule_task(self):
-        dt_str = self.dt_edit.dateTime().toString(Qt.DefaultLocaleShortDate)
+        dt_str = self.dt_edit.dateTime().toString(Qt.ISODate)
         task_str = self.task_edit.text().strip()
         notes_str = self.notes_edit.text().strip()
 
-        SCHEDULE.append({"datetime": dt_str, "task": task_str, "notes": notes_str})
+        SCHEDULE.append(ScheduleEntry(datetime=dt_str, task=task_str, notes=notes_str))
+        self.model.sync_appended()
+        self.main_window.data_signals.recordAdded.emit("schedule", len(SCHEDULE) - 1)
         QMessageBox.information(self, "Scheduled Task Added", "Task has been scheduled.")
         self.task_edit.clear()
         self.notes_edit.clear()
-        self.main_window.refresh_all_tabs()
 
 
 ###############################################################################
@@ -990,9 +1717,16 @@ class ShiftManagementTab(QWidget):
         title.setStyleSheet("font-size: 16px; font-weight: bold;")
         layout.addWidget(title)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Employee", "Start", "End", "Role"])
+        self.model = DictTableModel(
+            ["Employee", "Start", "End", "Role"], SHIFTS,
+            keys=("employee", "start", "end", "role")
+        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # Fixed widths, so adding a row never re-measures the whole column
+        header = self.table.horizontalHeader()
+        header.setDefaultSectionSize(TABLE_COLUMN_WIDTH)
+        header.setSectionResizeMode(QHeaderView.Interactive)
         layout.addWidget(self.table)
 
         if self.user_role in ["Admin", "InventoryManager"]:
@@ -1003,7 +1737,7 @@ class ShiftManagementTab(QWidget):
             self.end_edit = QDateTimeEdit()
             self.end_edit.setDateTime(QDateTime.currentDateTime().addSecs(3600))
             self.role_combo = QComboBox()
-            self.role_combo.addItems(["ProductionWorker", "InventoryManager", "Sales", "Admin"])
+            self.role_combo.addItems(SHIFT_ROLE_CHOICES)
 
             form_layout.addRow("Employee Name:", self.emp_name)
             form_layout.addRow("Start:", self.start_edit)
@@ -1016,33 +1750,21 @@ class ShiftManagementTab(QWidget):
             layout.addWidget(add_btn)
 
         self.setLayout(layout)
-        self.refresh_shift_view()
 
     def refresh_shift_view(self):
-        self.table.setRowCount(len(SHIFTS))
-        for row, shift in enumerate(SHIFTS):
-            emp = shift["employee"]
-            start = shift["start"]
-            end = shift["end"]
-            role = shift["role"]
-
-            self.table.setItem(row, 0, QTableWidgetItem(emp))
-            self.table.setItem(row, 1, QTableWidgetItem(str(start)))
-            self.table.setItem(row, 2, QTableWidgetItem(str(end)))
-            self.table.setItem(row, 3, QTableWidgetItem(role))
-
-        self.table.resizeColumnsToContents()
+        self.model.refresh()
 
     def add_shift(self):
         emp = self.emp_name.text().strip()
-        start_str = self.start_edit.dateTime().toString(Qt.DefaultLocaleShortDate)
-        end_str = self.end_edit.dateTime().toString(Qt.DefaultLocaleShortDate)
+        start_str = self.start_edit.dateTime().toString(Qt.ISODate)
+        end_str = self.end_edit.dateTime().toString(Qt.ISODate)
         role = self.role_combo.currentText()
 
-        SHIFTS.append({"employee": emp, "start": start_str, "end": end_str, "role": role})
+        SHIFTS.append(Shift(employee=emp, start=start_str, end=end_str, role=role))
+        self.model.sync_appended()
+        self.main_window.data_signals.recordAdded.emit("shifts", len(SHIFTS) - 1)
         QMessageBox.information(self, "Shift Added", f"Shift for {emp} added.")
         self.emp_name.clear()
-        self.main_window.refresh_all_tabs()
 
 
 ###############################################################################
@@ -1059,16 +1781,27 @@ class UserManagementTab(QWidget):
         title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
         layout.addWidget(title_label)
 
-        self.user_table = QTableWidget()
-        self.user_table.setColumnCount(4)
-        self.user_table.setHorizontalHeaderLabels(["Username", "Password", "Role", "Action"])
+        # (username, password, role) per row, kept in step with USER_DB by
+        # refresh_user_table(); "Action" holds the Delete buttons, which are
+        # created once per user and kept in _user_buttons
+        self._user_rows = []
+        self._user_buttons = {}
+        self.user_model = DictTableModel(
+            ["Username", "Password", "Role", "Action"], self._user_rows,
+            keys=(0, 1, 2, None)
+        )
+        self.user_table = QTableView()
+        self.user_table.setModel(self.user_model)
+        header = self.user_table.horizontalHeader()
+        header.setDefaultSectionSize(TABLE_COLUMN_WIDTH)
+        header.setSectionResizeMode(QHeaderView.Interactive)
         layout.addWidget(self.user_table)
 
         form_layout = QFormLayout()
         self.new_username = QLineEdit()
         self.new_password = QLineEdit()
         self.new_role_combo = QComboBox()
-        self.new_role_combo.addItems(["Admin", "ProductionWorker", "InventoryManager", "Sales"])
+        self.new_role_combo.addItems(ROLE_CHOICES)
         form_layout.addRow("New Username:", self.new_username)
         form_layout.addRow("New Password:", self.new_password)
         form_layout.addRow("Role:", self.new_role_combo)
@@ -1080,30 +1813,34 @@ class UserManagementTab(QWidget):
         layout.addLayout(form_layout)
         self.setLayout(layout)
 
-        self.refresh_user_table()
-
     def refresh_user_table(self):
-        from __main__ import USER_DB
-
-        self.user_table.setRowCount(len(USER_DB))
-        for row, (uname, (pwd, role)) in enumerate(USER_DB.items()):
-            uname_item = QTableWidgetItem(uname)
-            pwd_item = QTableWidgetItem(pwd)
-            role_item = QTableWidgetItem(role)
-
-            self.user_table.setItem(row, 0, uname_item)
-            self.user_table.setItem(row, 1, pwd_item)
-            self.user_table.setItem(row, 2, role_item)
-
-            btn = QPushButton("Delete")
-            btn.clicked.connect(lambda checked, u=uname: self.delete_user(u))
-            self.user_table.setCellWidget(row, 3, btn)
-
-        self.user_table.resizeColumnsToContents()
+        with batched_table_update(self.user_table):
+            # Users that are gone: the view deletes their buttons with the rows
+            for row in reversed(range(len(self._user_rows))):
+                uname = self._user_rows[row][0]
+                if uname not in USER_DB:
+                    with self.user_model.removing_row(row):
+                        del self._user_rows[row]
+                    del self._user_buttons[uname]
+
+            for row, (uname, _, _) in enumerate(self._user_rows):
+                self._user_rows[row] = (uname, *USER_DB[uname])
+            self.user_model.refresh_values()
+
+            # Only users without a button yet get a new row and button
+            for uname, (pwd, role) in USER_DB.items():
+                if uname not in self._user_buttons:
+                    self._append_user(uname, pwd, role)
+
+    def _append_user(self, uname, pwd, role):
+        self._user_rows.append((uname, pwd, role))
+        self.user_model.sync_appended()
+        btn = QPushButton("Delete")
+        btn.clicked.connect(lambda checked, u=uname: self.delete_user(u))
+        self.user_table.setIndexWidget(self.user_model.index(len(self._user_rows) - 1, 3), btn)
+        self._user_buttons[uname] = btn
 
     def create_user(self):
-        from __main__ import USER_DB
-
         uname = self.new_username.text().strip()
         pwd = self.new_password.text().strip()
         role = self.new_role_combo.currentText()
@@ -1116,14 +1853,13 @@ class UserManagementTab(QWidget):
             return
 
         USER_DB[uname] = (pwd, role)
+        self._append_user(uname, pwd, role)
+        self.main_window.data_signals.userChanged.emit(uname)
         QMessageBox.information(self, "User Created", f"User '{uname}' with role '{role}' created.")
         self.new_username.clear()
         self.new_password.clear()
-        self.main_window.refresh_all_tabs()
 
     def delete_user(self, uname):
-        from __main__ import USER_DB
-
         if uname not in USER_DB:
             QMessageBox.warning(self, "User Not Found", f"No user named '{uname}' in system.")
             return
@@ -1138,40 +1874,61 @@ class UserManagementTab(QWidget):
             f"Are you sure you want to delete user '{uname}'?"
         )
         if result == QMessageBox.Yes:
+            # The Delete buttons of the rows below move up with them
+            row = next(r for r, record in enumerate(self._user_rows) if record[0] == uname)
+            with self.user_model.removing_row(row):
+                del self._user_rows[row]
+            del self._user_buttons[uname]
             del USER_DB[uname]
+            self.main_window.data_signals.userChanged.emit(uname)
             QMessageBox.information(self, "User Deleted", f"User '{uname}' removed.")
-            self.main_window.refresh_all_tabs()
 
 
 ###############################################################################
 # 13. main() - Entry Point
 ###############################################################################
+# (role, color) pairs for the dark theme, applied on top of Fusion's palette
+DARK_PALETTE_COLORS = (
+    (QPalette.Window, QColor(53, 53, 53)),
+    (QPalette.WindowText, QColor(Qt.white)),
+    (QPalette.Base, QColor(25, 25, 25)),
+    (QPalette.AlternateBase, QColor(53, 53, 53)),
+    (QPalette.ToolTipBase, QColor(Qt.white)),
+    (QPalette.ToolTipText, QColor(Qt.white)),
+    (QPalette.Text, QColor(Qt.white)),
+    (QPalette.Button, QColor(53, 53, 53)),
+    (QPalette.ButtonText, QColor(Qt.white)),
+    (QPalette.BrightText, QColor(Qt.red)),
+    (QPalette.Link, QColor(42, 130, 218)),
+    (QPalette.Highlight, QColor(42, 130, 218)),
+    (QPalette.HighlightedText, QColor(Qt.black))
+)
+
+
+def _build_dark_palette():
+    """
+    Dark palette for the whole app. Call after the style is set: QPalette()
+    starts from the current application palette, which supplies the roles
+    not listed in DARK_PALETTE_COLORS.
+    """
+    palette = QPalette()
+    for role, color in DARK_PALETTE_COLORS:
+        palette.setColor(role, color)
+    return palette
+
+
 def main():
     app = QApplication(sys.argv)
 
     # Fusion style + dark palette
     app.setStyle("Fusion")
-    dark_palette = QPalette()
-    dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.WindowText, Qt.white)
-    dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
-    dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ToolTipBase, Qt.white)
-    dark_palette.setColor(QPalette.ToolTipText, Qt.white)
-    dark_palette.setColor(QPalette.Text, Qt.white)
-    dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ButtonText, Qt.white)
-    dark_palette.setColor(QPalette.BrightText, Qt.red)
-    dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.HighlightedText, Qt.black)
-    app.setPalette(dark_palette)
-
-    app.setStyleSheet("QToolTip { color: #ffffff; background-color: #2a82da; border: none; }")
+    app.setPalette(_build_dark_palette())
 
     # Show the login dialog first
     login_dialog = LoginDialog()
     if login_dialog.exec() == QDialog.Accepted and login_dialog.selected_role:
+        # Only styles tooltips, so it can wait until the login dialog is done
+        app.setStyleSheet("QToolTip { color: #ffffff; background-color: #2a82da; border: none; }")
         window = MainWindow(user_role=login_dialog.selected_role)
         window.show()
         sys.exit(app.exec())